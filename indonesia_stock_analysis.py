@@ -1,16 +1,18 @@
-import yfinance as yf
+import os
+import functools
+import types
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# yfinance, matplotlib and the Numba kernels are imported inside the functions
+# that use them so importing this module stays cheap
 
+CACHE_DIR = '.cache'
+
+@functools.lru_cache(maxsize=1)
 def get_indonesia_stocks():
     """
     Get most active Indonesian stocks from Yahoo Finance
@@ -42,82 +44,158 @@ def get_indonesia_stocks():
         'GOTO.JK': 'GoTo Gojek Tokopedia Tbk'
     }
     
-    return indonesia_stocks
+    # Cached and shared by every caller, so hand out a read-only view
+    return types.MappingProxyType(indonesia_stocks)
+
+SYMBOLS = tuple(get_indonesia_stocks().keys())
+
+def _cache_path(symbol, period):
+    """
+    Location of the cached price history for a symbol, keyed by period and day
+    """
+    return os.path.join(CACHE_DIR, period, str(date.today()), f"{symbol}.parquet")
+
+def _to_float32(hist):
+    """
+    Store Close/Volume as float32 to halve the memory traffic of the metric passes
+    """
+    return hist.astype({'Close': np.float32, 'Volume': np.float32})
 
 def fetch_stock_data(symbols, period='1mo'):
     """
-    Fetch stock data for given symbols
+    Fetch stock data for given symbols, reusing today's on-disk cache and
+    downloading the remaining symbols in a single batched request
     """
+    symbols = list(symbols)
     data = {}
+    
+    missing = []
     for symbol in symbols:
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
-            if not hist.empty:
-                data[symbol] = hist
-                print(f"✓ Fetched data for {symbol}")
-            else:
-                print(f"✗ No data for {symbol}")
-        except Exception as e:
-            print(f"✗ Error fetching {symbol}: {e}")
-    
-    return data
+        path = _cache_path(symbol, period)
+        if os.path.exists(path):
+            data[symbol] = _to_float32(pd.read_parquet(path))
+            print(f"✓ Loaded cached data for {symbol}")
+        else:
+            missing.append(symbol)
+    
+    if not missing:
+        return data
+    
+    import yfinance as yf
+    
+    try:
+        raw = yf.download(" ".join(missing), period=period, group_by='ticker',
+                          threads=True, auto_adjust=True, progress=False)
+    except Exception as e:
+        print(f"✗ Error fetching data: {e}")
+        return data
+    
+    if isinstance(raw.columns, pd.MultiIndex):
+        frames = {s: raw[s] for s in set(raw.columns.get_level_values(0))}
+    elif len(missing) == 1:
+        # Older yfinance releases return flat columns for a single-ticker download
+        frames = {missing[0]: raw}
+    else:
+        frames = {}
+    for symbol in missing:
+        hist = frames[symbol].dropna(how='all') if symbol in frames else raw.iloc[0:0]
+        if not hist.empty:
+            hist = _to_float32(hist)
+            data[symbol] = hist
+            print(f"✓ Fetched data for {symbol}")
+            try:
+                path = _cache_path(symbol, period)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                hist.to_parquet(path)
+            except Exception as e:
+                print(f"✗ Could not cache {symbol}: {e}")
+        else:
+            print(f"✗ No data for {symbol}")
+    
+    # Keep the caller's symbol order regardless of which source served each one
+    return {s: data[s] for s in symbols if s in data}
+
+def _bottom_align(values):
+    """
+    Shift each column's valid (non-NaN) values to the bottom of a date x symbol array,
+    keeping their order, so row -k holds every symbol's k-th most recent bar
+    Returns the aligned array and the number of valid bars per column
+    """
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    rows = np.cumsum(valid, axis=0) - 1 + (len(values) - counts)
+    cols = np.broadcast_to(np.arange(values.shape[1]), values.shape)
+    aligned = np.full_like(values, np.nan)
+    aligned[rows[valid], cols[valid]] = values[valid]
+    return aligned, counts
 
 def calculate_metrics(stock_data):
     """
-    Calculate key metrics for each stock
+    Calculate key metrics for all stocks at once on wide (date x symbol) frames
     """
-    metrics = {}
-    
-    for symbol, data in stock_data.items():
-        if len(data) < 5:  # Need at least 5 days of data
-            continue
-            
-        # Calculate daily returns
-        data['Returns'] = data['Close'].pct_change()
-        
-        # Calculate change percentage (from 30 days ago to today)
-        if len(data) >= 30:
-            change_pct = ((data['Close'].iloc[-1] - data['Close'].iloc[-30]) / data['Close'].iloc[-30]) * 100
-        else:
-            change_pct = ((data['Close'].iloc[-1] - data['Close'].iloc[0]) / data['Close'].iloc[0]) * 100
-        
-        # Volume metrics
-        avg_volume = data['Volume'].mean()
-        recent_volume = data['Volume'].tail(5).mean()
-        volume_trend = (recent_volume - avg_volume) / avg_volume * 100
-        
-        # Price metrics
-        current_price = data['Close'].iloc[-1]
-        price_volatility = data['Returns'].std() * np.sqrt(252) * 100  # Annualized volatility
-        
-        # Technical indicators
-        sma_20 = data['Close'].rolling(window=20).mean().iloc[-1] if len(data) >= 20 else current_price
-        sma_50 = data['Close'].rolling(window=50).mean().iloc[-1] if len(data) >= 50 else current_price
-        
-        # RSI calculation
-        delta = data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        current_rsi = rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50
-        
-        metrics[symbol] = {
-            'Current_Price': current_price,
-            'Change_Pct': change_pct,
-            'Avg_Volume': avg_volume,
-            'Recent_Volume': recent_volume,
-            'Volume_Trend': volume_trend,
-            'Volatility': price_volatility,
-            'SMA_20': sma_20,
-            'SMA_50': sma_50,
-            'RSI': current_rsi,
-            'Price_vs_SMA20': ((current_price - sma_20) / sma_20) * 100,
-            'Price_vs_SMA50': ((current_price - sma_50) / sma_50) * 100
-        }
-    
-    return metrics
+    from kernels import wilder_rsi
+    
+    # Need at least 5 days of data
+    stock_data = {s: d for s, d in stock_data.items() if d['Close'].count() >= 5}
+    if not stock_data:
+        return {}
+    
+    close = pd.concat({s: d['Close'] for s, d in stock_data.items()}, axis=1)
+    volume = pd.concat({s: d['Volume'] for s, d in stock_data.items()}, axis=1)
+    
+    # Extract the float32 arrays once and work on them from here on
+    symbols = close.columns
+    close_np = close.to_numpy(dtype=np.float32)
+    vol_np = volume.to_numpy(dtype=np.float32)
+    
+    # The panel is an outer join of the symbols' dates, so line up each symbol's own
+    # bars at the bottom; the last row is then every symbol's latest price
+    close_aligned, close_counts = _bottom_align(close_np)
+    current_price = pd.Series(close_aligned[-1], index=symbols)
+    
+    # Calculate daily returns
+    returns = np.diff(close_aligned, axis=0) / close_aligned[:-1]
+    
+    # Calculate change percentage (from 30 days ago, or the first available day, to today)
+    # Gather each symbol's base price in one go from its bottom-aligned valid bars
+    lookback = len(close_aligned) - np.minimum(close_counts, 30)
+    base_price = close_aligned[lookback, np.arange(close_aligned.shape[1])]
+    change_pct = (current_price / base_price - 1) * 100
+    
+    # Volume metrics
+    avg_volume = pd.Series(np.nanmean(vol_np, axis=0, dtype=np.float64), index=symbols)
+    vol_aligned, _ = _bottom_align(vol_np)
+    recent_volume = pd.Series(np.nanmean(vol_aligned[-5:], axis=0, dtype=np.float64), index=symbols)
+    volume_trend = (recent_volume - avg_volume) / avg_volume * 100
+    
+    # Price metrics
+    price_volatility = pd.Series(np.nanstd(returns, axis=0, ddof=1, dtype=np.float64), index=symbols) * np.sqrt(252) * 100  # Annualized volatility
+    
+    # Technical indicators (fall back to the current price on short histories)
+    # Only the latest SMA value is used, so average each symbol's last valid bars directly
+    sma_20 = pd.Series(np.where(close_counts >= 20, close_aligned[-20:].mean(axis=0, dtype=np.float64), current_price), index=symbols)
+    sma_50 = pd.Series(np.where(close_counts >= 50, close_aligned[-50:].mean(axis=0, dtype=np.float64), current_price), index=symbols)
+    
+    # RSI calculation (Wilder's smoothing)
+    current_rsi = pd.Series({
+        s: wilder_rsi(np.ascontiguousarray(col[~np.isnan(col)]), 14) for s, col in zip(symbols, close_np.T)
+    }).fillna(50)
+    
+    metrics = pd.DataFrame({
+        'Current_Price': current_price,
+        'Change_Pct': change_pct,
+        'Avg_Volume': avg_volume,
+        'Recent_Volume': recent_volume,
+        'Volume_Trend': volume_trend,
+        'Volatility': price_volatility,
+        'SMA_20': sma_20,
+        'SMA_50': sma_50,
+        'RSI': current_rsi,
+        'Price_vs_SMA20': ((current_price - sma_20) / sma_20) * 100,
+        'Price_vs_SMA50': ((current_price - sma_50) / sma_50) * 100
+    })
+    
+    return metrics.to_dict(orient='index')
 
 def predict_stocks(metrics, top_n=5):
     """
@@ -126,106 +204,121 @@ def predict_stocks(metrics, top_n=5):
     if not metrics:
         return []
     
-    df = pd.DataFrame(metrics).T
+    # Pull the scoring inputs straight out of the metrics dict
+    symbols = list(metrics)
+    columns = {
+        key: np.fromiter((m[key] for m in metrics.values()), dtype=np.float64, count=len(metrics))
+        for key in ('Volume_Trend', 'Change_Pct', 'RSI', 'Price_vs_SMA20', 'Price_vs_SMA50')
+    }
     
     # Scoring system (higher score = better prediction)
-    scores = {}
-    
-    for symbol in df.index:
-        score = 0
-        
+    factors = np.column_stack([
         # Volume factor (30% weight)
-        volume_score = min(df.loc[symbol, 'Volume_Trend'] / 10, 10)  # Cap at 10
-        score += volume_score * 0.3
-        
+        np.minimum(columns['Volume_Trend'] / 10, 10),  # Cap at 10
         # Price momentum (25% weight)
-        change_score = min(df.loc[symbol, 'Change_Pct'] / 5, 10)  # Cap at 10
-        score += change_score * 0.25
-        
+        np.minimum(columns['Change_Pct'] / 5, 10),  # Cap at 10
         # Technical indicators (25% weight)
         # RSI between 30-70 is good
-        rsi_score = 10 - abs(df.loc[symbol, 'RSI'] - 50) / 5
-        rsi_score = max(0, min(rsi_score, 10))
-        score += rsi_score * 0.25
-        
+        np.clip(10 - np.abs(columns['RSI'] - 50) / 5, 0, 10),
         # Price vs moving averages (20% weight)
-        sma_score = (df.loc[symbol, 'Price_vs_SMA20'] + df.loc[symbol, 'Price_vs_SMA50']) / 2
-        sma_score = min(sma_score / 2, 10)  # Cap at 10
-        score += sma_score * 0.2
-        
-        scores[symbol] = score
+        np.minimum((columns['Price_vs_SMA20'] + columns['Price_vs_SMA50']) / 4, 10)  # Cap at 10
+    ])
+    weights = np.array([0.3, 0.25, 0.25, 0.2])
+    scores = weights @ factors.T
     
     # Sort by score and return top N
-    sorted_stocks = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    return sorted_stocks[:top_n]
+    order = np.argsort(-scores, kind='stable')[:top_n]
+    order = order[~np.isnan(scores[order])]
+    return [(symbols[i], float(scores[i])) for i in order]
 
 def create_analysis_plots(stock_data, metrics, predictions):
     """
     Create comprehensive analysis plots
     """
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('Indonesia Stock Market Analysis - Most Active Stocks', fontsize=16, fontweight='bold')
-    
-    # Plot 1: Change Percentage
-    symbols = list(metrics.keys())
-    changes = [metrics[s]['Change_Pct'] for s in symbols]
-    
-    colors = ['green' if x > 0 else 'red' for x in changes]
-    bars1 = axes[0, 0].bar(range(len(symbols)), changes, color=colors, alpha=0.7)
-    axes[0, 0].set_title('Change Percentage (Last 30 Days)', fontweight='bold')
-    axes[0, 0].set_ylabel('Change (%)')
-    axes[0, 0].set_xticks(range(len(symbols)))
-    axes[0, 0].set_xticklabels([s.replace('.JK', '') for s in symbols], rotation=45)
-    axes[0, 0].axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    
-    # Add value labels on bars
-    for bar, change in zip(bars1, changes):
-        height = bar.get_height()
-        axes[0, 0].text(bar.get_x() + bar.get_width()/2., height + (0.1 if height > 0 else -0.5),
-                        f'{change:.1f}%', ha='center', va='bottom' if height > 0 else 'top', fontsize=8)
-    
-    # Plot 2: Volume Trend
-    volume_trends = [metrics[s]['Volume_Trend'] for s in symbols]
-    colors = ['blue' if x > 0 else 'orange' for x in volume_trends]
-    bars2 = axes[0, 1].bar(range(len(symbols)), volume_trends, color=colors, alpha=0.7)
-    axes[0, 1].set_title('Volume Trend (Recent vs Average)', fontweight='bold')
-    axes[0, 1].set_ylabel('Volume Change (%)')
-    axes[0, 1].set_xticks(range(len(symbols)))
-    axes[0, 1].set_xticklabels([s.replace('.JK', '') for s in symbols], rotation=45)
-    axes[0, 1].axhline(y=0, color='black', linestyle='-', alpha=0.3)
-    
-    # Plot 3: RSI Analysis
-    rsi_values = [metrics[s]['RSI'] for s in symbols]
-    colors = ['red' if x > 70 else 'green' if x < 30 else 'blue' for x in rsi_values]
-    bars3 = axes[1, 0].bar(range(len(symbols)), rsi_values, color=colors, alpha=0.7)
-    axes[1, 0].set_title('RSI (Relative Strength Index)', fontweight='bold')
-    axes[1, 0].set_ylabel('RSI Value')
-    axes[1, 0].set_xticks(range(len(symbols)))
-    axes[1, 0].set_xticklabels([s.replace('.JK', '') for s in symbols], rotation=45)
-    axes[1, 0].axhline(y=70, color='red', linestyle='--', alpha=0.7, label='Overbought')
-    axes[1, 0].axhline(y=30, color='green', linestyle='--', alpha=0.7, label='Oversold')
-    axes[1, 0].legend()
-    
-    # Plot 4: Prediction Scores
-    if predictions:
-        pred_symbols = [p[0].replace('.JK', '') for p in predictions]
-        pred_scores = [p[1] for p in predictions]
-        colors = plt.cm.viridis(np.linspace(0, 1, len(pred_scores)))
-        bars4 = axes[1, 1].bar(range(len(pred_symbols)), pred_scores, color=colors, alpha=0.8)
-        axes[1, 1].set_title('Top 5 Predicted Stocks (14-Day Outlook)', fontweight='bold')
-        axes[1, 1].set_ylabel('Prediction Score')
-        axes[1, 1].set_xticks(range(len(pred_symbols)))
-        axes[1, 1].set_xticklabels(pred_symbols, rotation=45)
+    import matplotlib
+    import matplotlib.style
+    from matplotlib.figure import Figure
+    
+    # Render on a standalone Figure under a temporary style (bundled with matplotlib)
+    # so the caller's pyplot backend, open figures and rcParams are left untouched
+    with matplotlib.style.context('seaborn-v0_8'):
+        fig = Figure(figsize=(16, 12))
+        axes = fig.subplots(2, 2)
+        fig.suptitle('Indonesia Stock Market Analysis - Most Active Stocks', fontsize=16, fontweight='bold')
+        
+        # Materialize the metrics once and slice columns per subplot
+        M = pd.DataFrame.from_dict(metrics, orient='index')
+        changes, volume_trends, rsi_values = M[['Change_Pct', 'Volume_Trend', 'RSI']].to_numpy().T
+        labels = M.index.str.replace('.JK', '', regex=False).to_numpy()
+        x = np.arange(len(M))
+        
+        # Shared symbol axis for the per-stock subplots
+        for ax in (axes[0, 0], axes[0, 1], axes[1, 0]):
+            ax.set_xticks(x)
+            ax.set_xticklabels(labels, rotation=45)
         
-        # Add score labels
-        for bar, score in zip(bars4, pred_scores):
+        # Plot 1: Change Percentage
+        bars1 = axes[0, 0].bar(x, changes, color=np.where(changes > 0, 'green', 'red'), alpha=0.7)
+        axes[0, 0].set_title('Change Percentage (Last 30 Days)', fontweight='bold')
+        axes[0, 0].set_ylabel('Change (%)')
+        axes[0, 0].axhline(y=0, color='black', linestyle='-', alpha=0.3)
+        
+        # Add value labels on bars
+        for bar, change in zip(bars1, changes):
             height = bar.get_height()
-            axes[1, 1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                           f'{score:.1f}', ha='center', va='bottom', fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('indonesia_stock_analysis.png', dpi=300, bbox_inches='tight')
-    plt.show()
+            axes[0, 0].text(bar.get_x() + bar.get_width()/2., height + (0.1 if height > 0 else -0.5),
+                            f'{change:.1f}%', ha='center', va='bottom' if height > 0 else 'top', fontsize=8)
+        
+        # Plot 2: Volume Trend
+        axes[0, 1].bar(x, volume_trends, color=np.where(volume_trends > 0, 'blue', 'orange'), alpha=0.7)
+        axes[0, 1].set_title('Volume Trend (Recent vs Average)', fontweight='bold')
+        axes[0, 1].set_ylabel('Volume Change (%)')
+        axes[0, 1].axhline(y=0, color='black', linestyle='-', alpha=0.3)
+        
+        # Plot 3: RSI Analysis
+        rsi_colors = np.select([rsi_values > 70, rsi_values < 30], ['red', 'green'], default='blue')
+        axes[1, 0].bar(x, rsi_values, color=rsi_colors, alpha=0.7)
+        axes[1, 0].set_title('RSI (Relative Strength Index)', fontweight='bold')
+        axes[1, 0].set_ylabel('RSI Value')
+        axes[1, 0].axhline(y=70, color='red', linestyle='--', alpha=0.7, label='Overbought')
+        axes[1, 0].axhline(y=30, color='green', linestyle='--', alpha=0.7, label='Oversold')
+        axes[1, 0].legend()
+        
+        # Plot 4: Prediction Scores
+        if predictions:
+            # Reuse the precomputed labels for the predicted symbols
+            pred_labels = labels[M.index.get_indexer([p[0] for p in predictions])]
+            pred_scores = np.fromiter((p[1] for p in predictions), dtype=np.float64, count=len(predictions))
+            pred_x = np.arange(len(pred_scores))
+            colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(pred_scores)))
+            bars4 = axes[1, 1].bar(pred_x, pred_scores, color=colors, alpha=0.8)
+            axes[1, 1].set_title('Top 5 Predicted Stocks (14-Day Outlook)', fontweight='bold')
+            axes[1, 1].set_ylabel('Prediction Score')
+            axes[1, 1].set_xticks(pred_x)
+            axes[1, 1].set_xticklabels(pred_labels, rotation=45)
+        
+            # Add score labels
+            for bar, score in zip(bars4, pred_scores):
+                height = bar.get_height()
+                axes[1, 1].text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                               f'{score:.1f}', ha='center', va='bottom', fontweight='bold')
+        
+        fig.tight_layout()
+        fig.savefig('indonesia_stock_analysis.png', dpi=300, bbox_inches='tight')
+
+def _format_table(table, formatters, numeric):
+    """
+    Render a report table with left-aligned text columns and right-aligned numeric
+    columns, padding headers to match so they line up over their values
+    """
+    cells, headers = {}, []
+    for col in table.columns:
+        values = table[col].map(formatters.get(col, str))
+        width = max([len(col), *values.str.len()])
+        align = str.rjust if col in numeric else str.ljust
+        cells[col] = values.map(lambda v: align(v, width))
+        headers.append(align(col, width))
+    return pd.DataFrame(cells).to_string(index=False, header=headers, justify='left')
 
 def main():
     """
@@ -239,7 +332,7 @@ def main():
     print(f"📊 Analyzing {len(indonesia_stocks)} major Indonesian stocks...")
     
     # Fetch stock data
-    stock_data = fetch_stock_data(indonesia_stocks.keys(), period='2mo')
+    stock_data = fetch_stock_data(SYMBOLS, period='2mo')
     
     if not stock_data:
         print("❌ No stock data available. Please check your internet connection.")
@@ -255,29 +348,45 @@ def main():
         return
     
     # Sort by change percentage
-    sorted_by_change = sorted(metrics.items(), key=lambda x: x[1]['Change_Pct'], reverse=True)
+    report = pd.DataFrame.from_dict(metrics, orient='index').sort_values('Change_Pct', ascending=False)
+    symbols = report.index.to_series()
+    table = pd.DataFrame({
+        'Symbol': symbols.str.replace('.JK', '', regex=False),
+        'Name': symbols.map(indonesia_stocks.get).fillna('Unknown').str[:28],
+        'Change%': report['Change_Pct'],
+        'Price': report['Current_Price'],
+        'Volume Trend%': report['Volume_Trend']
+    })
     
     print("\n📋 Most Active Indonesian Stocks (Sorted by Change %):")
     print("-" * 80)
-    print(f"{'Symbol':<10} {'Name':<30} {'Change%':<10} {'Price':<10} {'Volume Trend%':<15}")
-    print("-" * 80)
-    
-    for symbol, metric in sorted_by_change:
-        name = indonesia_stocks.get(symbol, 'Unknown')
-        print(f"{symbol.replace('.JK', ''):<10} {name[:28]:<30} {metric['Change_Pct']:>8.1f}% {metric['Current_Price']:>8.0f} {metric['Volume_Trend']:>12.1f}%")
+    print(_format_table(table, {
+        'Change%': '{:.1f}%'.format,
+        'Price': '{:.0f}'.format,
+        'Volume Trend%': '{:.1f}%'.format
+    }, numeric={'Change%', 'Price', 'Volume Trend%'}))
     
     # Predict top 5 stocks
     predictions = predict_stocks(metrics, top_n=5)
     
+    top = pd.DataFrame(predictions, columns=['Symbol', 'Score'])
+    table = pd.DataFrame({
+        'Rank': range(1, len(top) + 1),
+        'Symbol': top['Symbol'].str.replace('.JK', '', regex=False),
+        'Name': top['Symbol'].map(indonesia_stocks.get).fillna('Unknown').str[:28],
+        'Score': top['Score'],
+        'Current Price': report.loc[top['Symbol'], 'Current_Price'].to_numpy(),
+        'Change%': report.loc[top['Symbol'], 'Change_Pct'].to_numpy()
+    })
+    
     print("\n🎯 Top 5 Predicted Stocks for Next 14 Days:")
     print("-" * 80)
-    print(f"{'Rank':<5} {'Symbol':<10} {'Name':<30} {'Score':<8} {'Current Price':<15} {'Change%':<10}")
-    print("-" * 80)
-    
-    for i, (symbol, score) in enumerate(predictions, 1):
-        name = indonesia_stocks.get(symbol, 'Unknown')
-        metric = metrics[symbol]
-        print(f"{i:<5} {symbol.replace('.JK', ''):<10} {name[:28]:<30} {score:>6.1f} {metric['Current_Price']:>12.0f} {metric['Change_Pct']:>8.1f}%")
+    print(_format_table(table, {
+        'Rank': '{:<5}'.format,
+        'Score': '{:.1f}'.format,
+        'Current Price': '{:.0f}'.format,
+        'Change%': '{:.1f}%'.format
+    }, numeric={'Score', 'Current Price', 'Change%'}))
     
     # Create detailed analysis for top predictions
     print("\n📊 Detailed Analysis of Top Predictions:")
@@ -0,0 +1,25 @@
+"""
+Numeric kernels used by the stock analysis scripts
+
+The RSI kernel is loaded from the ahead-of-time compiled ``rsi_aot`` extension
+when it has been built (``python -m kernels._rsi_aot``), so no JIT warmup is paid
+at runtime. Without the extension it falls back to Numba's JIT.
+"""
+import numpy as np
+
+try:
+    from .rsi_aot import wilder_rsi_f4 as _wilder_rsi_f4, wilder_rsi_f8 as _wilder_rsi_f8
+except ImportError:
+    from numba import njit
+    from .rsi import wilder_rsi as _wilder_rsi
+    wilder_rsi = njit(cache=True)(_wilder_rsi)
+else:
+    def wilder_rsi(close, n=14):
+        """
+        Dispatch to the AOT entry point matching the input dtype
+        The exports trust their signature, so anything other than a 1-D float32
+        array is converted to contiguous float64 first
+        """
+        if isinstance(close, np.ndarray) and close.dtype == np.float32 and close.ndim == 1:
+            return _wilder_rsi_f4(close, int(n))
+        return _wilder_rsi_f8(np.ascontiguousarray(close, dtype=np.float64).ravel(), int(n))
@@ -0,0 +1,19 @@
+"""
+Ahead-of-time build of the RSI kernel
+
+Run ``python -m kernels._rsi_aot`` from the project root to produce the
+``kernels/rsi_aot`` extension module for the current platform. Exported
+functions do not check their argument types, so one entry point is exported
+per supported dtype and ``kernels.wilder_rsi`` dispatches between them.
+"""
+import os
+from numba.pycc import CC
+from kernels.rsi import wilder_rsi
+
+cc = CC('rsi_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('wilder_rsi_f4', 'f8(f4[:], i8)')(wilder_rsi)
+cc.export('wilder_rsi_f8', 'f8(f8[:], i8)')(wilder_rsi)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,32 @@
+import numpy as np
+
+def wilder_rsi(close, n=14):
+    """
+    Wilder's RSI of a 1-D close array, returned for the last bar
+    Uses a running RMA of gains/losses seeded with the mean of the first n deltas;
+    deltas are accumulated in float64 even when the prices are stored as float32
+    """
+    if close.shape[0] <= n:
+        return np.nan
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        delta = float(close[i]) - float(close[i - 1])
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= n
+    avg_loss /= n
+    
+    for i in range(n + 1, close.shape[0]):
+        delta = float(close[i]) - float(close[i - 1])
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+    
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
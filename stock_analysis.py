@@ -1,8 +1,10 @@
+import os
+import json
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
 # Define the stock symbol and timeframe
 ticker = 'PYFA.JK'
@@ -10,25 +12,64 @@ start_date = '2025-01-01'
 end_date = datetime.today().strftime('%Y-%m-%d')
 
 # Download historical data
-data = yf.download(ticker, start=start_date, end=end_date)
+data = yf.download(ticker, start=start_date, end=end_date, auto_adjust=True, progress=False)
 
 # Check if data is available
 if data.empty:
     raise ValueError('No data found for the specified period.')
 
+# Keep only the columns used below and share one contiguous Close array
+data = data[['Close', 'Volume']].astype(np.float32)
+close = np.ascontiguousarray(data['Close'].to_numpy().ravel())
+
 # Plot trading volume and closing price
-data[['Close', 'Volume']].plot(subplots=True, figsize=(12, 8), title=['Closing Price', 'Trading Volume'])
+data.plot(subplots=True, figsize=(12, 8), title=['Closing Price', 'Trading Volume'])
 plt.tight_layout()
 plt.show()
 
 # Forecasting next 7 days closing price using Holt-Winters Exponential Smoothing
-model = ExponentialSmoothing(data['Close'], trend='add', seasonal=None, initialization_method='estimated')
-fit = model.fit()
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+# Reuse the previous run's fitted parameters when the same series (same start date)
+# has grown by at most one bar, otherwise re-run the optimizer and cache the result
+holt_cache = os.path.join('.cache', f'holt_{ticker}.json')
+cached_fit = None
+if os.path.exists(holt_cache):
+    try:
+        with open(holt_cache) as f:
+            cached_fit = json.load(f)
+    except (OSError, ValueError):
+        cached_fit = None  # An unreadable cache is just a miss
+
+reuse_fit = False
+if cached_fit and cached_fit.get('start_date') == start_date:
+    cached_len = cached_fit.get('length', 0)
+    reuse_fit = (len(close) - cached_len in (0, 1) and cached_len > 0
+                 and cached_fit.get('last_index') == str(data.index[cached_len - 1]))
+
+if reuse_fit:
+    model = ExponentialSmoothing(close, trend='add', seasonal=None, initialization_method='known',
+                                 initial_level=cached_fit['initial_level'], initial_trend=cached_fit['initial_trend'])
+    fit = model.fit(smoothing_level=cached_fit['smoothing_level'], smoothing_trend=cached_fit['smoothing_trend'],
+                    optimized=False)
+else:
+    model = ExponentialSmoothing(close, trend='add', seasonal=None, initialization_method='estimated')
+    fit = model.fit()
+    # Build the entry before touching the file, with a plain loop rather than a
+    # comprehension so it also works when server.py exec()s this script
+    holt_params = {'start_date': start_date, 'length': len(close), 'last_index': str(data.index[-1])}
+    for key in ('smoothing_level', 'smoothing_trend', 'initial_level', 'initial_trend'):
+        holt_params[key] = float(fit.params[key])
+    # Write to a temp file and swap it in so a failed write never leaves a broken cache
+    os.makedirs(os.path.dirname(holt_cache), exist_ok=True)
+    with open(holt_cache + '.tmp', 'w') as f:
+        json.dump(holt_params, f)
+    os.replace(holt_cache + '.tmp', holt_cache)
 forecast = fit.forecast(7)
 
 # Plot the forecast
 plt.figure(figsize=(10, 5))
-plt.plot(data.index, data['Close'], label='Historical Close')
+plt.plot(data.index, close, label='Historical Close')
 plt.plot(pd.date_range(data.index[-1] + pd.Timedelta(days=1), periods=7, freq='B'), forecast, label='7-Day Forecast', linestyle='--')
 plt.title('PYFA.JK Closing Price Forecast (Next 7 Business Days)')
 plt.xlabel('Date')